@@ -113,9 +113,16 @@ async function loadModelInfo() {
         modelInfo = await response.json();
         console.log('📊 Model info loaded:', modelInfo);
         
-        // Update model size display
+        // Update model size displays (header badge + comparison table)
         document.getElementById('modelSize').textContent = `${modelInfo.model_size_kb.toFixed(2)} KB`;
-        
+        document.getElementById('modelSizeCompare').textContent = `${modelInfo.model_size_kb.toFixed(2)} KB`;
+
+        // Accuracy measured on the test split during training
+        if (modelInfo.accuracy) {
+            document.getElementById('accuracyRate').textContent =
+                `${(modelInfo.accuracy * 100).toFixed(2)}%`;
+        }
+
     } catch (error) {
         console.warn('⚠️ Could not load model_info.json:', error);
     }
@@ -289,22 +296,22 @@ async function runPrediction() {
         // Create ONNX tensor (shape: [1, 6])
         const inputTensor = new ort.Tensor('float32', inputArray, [1, 6]);
 
-        // Run inference - only request the label output to avoid probability map issues
+        // Run inference - model emits 'label' plus a plain 'probabilities'
+        // tensor (ZipMap disabled at conversion time)
         const feeds = { float_input: inputTensor };
-        const fetchOutputs = ['output_label']; // Only fetch label, skip probability map
-        const results = await session.run(feeds, fetchOutputs);
+        const results = await session.run(feeds);
 
         // Get prediction (label) - convert BigInt to Number
-        const outputLabel = Number(results.output_label.data[0]);
+        const outputLabel = Number(results.label.data[0]);
 
-        // No probability data available (DecisionTree outputs it as map, not tensor)
-        let outputProb = null;
+        // Probabilities are a [1, 2] float tensor: [prob_empty, prob_occupied]
+        const outputProb = results.probabilities;
 
         const endTime = performance.now();
         inferenceTime = endTime - startTime;
 
         console.log('🔮 Prediction:', outputLabel === 1 ? 'Occupied' : 'Empty');
-        console.log('   Raw label:', results.output_label.data[0], '→ Number:', outputLabel);
+        console.log('   Raw label:', results.label.data[0], '→ Number:', outputLabel);
         console.log('⚡ Inference time:', inferenceTime.toFixed(2), 'ms');
 
         // Display results
@@ -762,9 +769,9 @@ async function updateAllRooms() {
 
         const inputTensor = new ort.Tensor('float32', inputArray, [1, 6]);
         const feeds = { float_input: inputTensor };
-        const fetchOutputs = ['output_label'];
+        const fetchOutputs = ['label'];
         const results = await session.run(feeds, fetchOutputs);
-        const label = Number(results.output_label.data[0]);
+        const label = Number(results.label.data[0]);
 
         predictions.push({
             ...room,
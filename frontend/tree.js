@@ -0,0 +1,10 @@
+// Auto-generated by convert_to_onnx.py - do not edit by hand.
+// Straight-line decision tree predictor (1 = occupied, 0 = empty).
+// x = [hour, day_of_week, ambient_light, pir_motion, phone_presence, temperature]
+function predictOccupancy(x) {
+    if (x[2] <= 348.5) {
+        return 0;
+    } else {
+        return 1;
+    }
+}
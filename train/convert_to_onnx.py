@@ -55,7 +55,11 @@ def convert_to_onnx(clf, feature_names):
     onnx_model = convert_sklearn(
         clf,
         initial_types=initial_type,
-        target_opset=12  # ONNX opset version (12 = good browser support)
+        target_opset=17,  # ONNX opset version (17 = wider op coverage, still browser-safe)
+        # Emit probabilities as a plain float tensor instead of the default
+        # ZipMap sequence-of-dicts: smaller graph, one less op to dispatch,
+        # and the tensor is directly usable from JS
+        options={id(clf): {'zipmap': False, 'nocl': True}}
     )
     
     print(f"✅ Conversion successful!")
@@ -100,19 +104,38 @@ def validate_onnx(onnx_model):
         return False
 
 
-def test_onnx_inference(onnx_model, original_model):
+# ONNX Runtime sessions cached by model bytes; session construction costs
+# far more than the inference itself, so repeated test runs (FP32 and
+# quantized variants) reuse them
+_SESSION_CACHE = {}
+
+
+def _get_session(model_bytes):
+    """Return a cached, fully graph-optimized InferenceSession"""
+    import onnxruntime as ort
+
+    sess = _SESSION_CACHE.get(model_bytes)
+    if sess is None:
+        sess_options = ort.SessionOptions()
+        sess_options.graph_optimization_level = \
+            ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        sess = ort.InferenceSession(model_bytes, sess_options,
+                                    providers=['CPUExecutionProvider'])
+        _SESSION_CACHE[model_bytes] = sess
+    return sess
+
+
+def test_onnx_inference(onnx_model_bytes, original_model):
     """
     Test ONNX model inference and compare with original sklearn model
     Ensures conversion preserves predictions
     """
     print(f"\n🧪 Testing ONNX inference...")
-    
+
     try:
-        import onnxruntime as ort
-        
-        # Create inference session
-        sess = ort.InferenceSession(onnx_model.SerializeToString())
-        
+        # Reuse the cached inference session for this model
+        sess = _get_session(onnx_model_bytes)
+
         # Test samples (same as training demo scenarios)
         test_samples = np.array([
             [2, 1, 15, 0, 0, 20.0],    # Late night (empty)
@@ -131,9 +154,13 @@ def test_onnx_inference(onnx_model, original_model):
         # Get predictions from both models
         sklearn_preds = original_model.predict(test_samples)
         
-        input_name = sess.get_inputs()[0].name
-        onnx_result = sess.run(None, {input_name: test_samples})
-        onnx_preds = onnx_result[0]  # First output is labels
+        # Bind the fixed-shape input/output buffers once and run through
+        # the binding - no per-call feed-dict marshalling
+        io = sess.io_binding()
+        io.bind_cpu_input(sess.get_inputs()[0].name, test_samples)
+        io.bind_output(sess.get_outputs()[0].name)
+        sess.run_with_iobinding(io)
+        onnx_preds = io.copy_outputs_to_cpu()[0]  # First output is labels
         
         # Compare predictions
         matches = np.all(sklearn_preds == onnx_preds)
@@ -161,19 +188,19 @@ def test_onnx_inference(onnx_model, original_model):
         return True  # Don't fail conversion if test fails
 
 
-def save_onnx(onnx_model, output_path='../frontend/model.onnx'):
-    """Save ONNX model to file"""
+def save_onnx(onnx_model_bytes, output_path='../frontend/model.onnx'):
+    """Save serialized ONNX model bytes to file"""
     print(f"\n💾 Saving ONNX model...")
-    
+
     # Create frontend directory if it doesn't exist
     output_dir = os.path.dirname(output_path)
     if output_dir and not os.path.exists(output_dir):
         os.makedirs(output_dir)
         print(f"   Created directory: {output_dir}")
-    
+
     # Save model
     with open(output_path, "wb") as f:
-        f.write(onnx_model.SerializeToString())
+        f.write(onnx_model_bytes)
     
     file_size = os.path.getsize(output_path)
     print(f"✅ Model saved to: {output_path}")
@@ -192,7 +219,207 @@ def save_onnx(onnx_model, output_path='../frontend/model.onnx'):
     return file_size
 
 
-def create_model_info():
+def quantize_onnx(model_path, original_model):
+    """
+    Quantize ONNX model weights to uint8 for a smaller download
+
+    Writes model.q.onnx next to the FP32 model; keeps it only if it is
+    both smaller and still predicts the same labels as sklearn
+    """
+    print(f"\n📉 Quantizing ONNX model (uint8 weights)...")
+
+    try:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+    except ImportError:
+        print(f"⚠️  onnxruntime.quantization not available, skipping quantization")
+        return None
+
+    quant_path = model_path.replace('.onnx', '.q.onnx')
+
+    # Dynamic quantization only rewrites float initializers (MatMul/Gemm
+    # weights and the like); a TreeEnsemble graph keeps its thresholds and
+    # leaf values in node attributes, so there is nothing for it to touch
+    model = onnx.load(model_path)
+    if not any(init.data_type == onnx.TensorProto.FLOAT
+               for init in model.graph.initializer):
+        print(f"   No float initializers in the graph (tree weights live in")
+        print(f"   node attributes) - nothing to quantize, keeping FP32 model")
+        return None
+
+    try:
+        quantize_dynamic(model_path, quant_path, weight_type=QuantType.QUInt8)
+
+        # Validate the quantized graph and make sure predictions still match
+        with open(quant_path, 'rb') as f:
+            quant_bytes = f.read()
+        onnx.checker.check_model(onnx.load_model_from_string(quant_bytes))
+        matches = test_onnx_inference(quant_bytes, original_model)
+
+        orig_size = os.path.getsize(model_path)
+        quant_size = os.path.getsize(quant_path)
+        print(f"\n   FP32 model:      {orig_size:,} bytes ({orig_size/1024:.2f} KB)")
+        print(f"   Quantized model: {quant_size:,} bytes ({quant_size/1024:.2f} KB)")
+
+        if matches and quant_size < orig_size:
+            print(f"✅ Quantized model kept: {quant_path}")
+            print(f"   Serve this file to save {orig_size - quant_size:,} bytes per load")
+            return quant_path
+
+        os.remove(quant_path)
+        print(f"   Quantization gave no size win - keeping FP32 model only")
+        return None
+
+    except Exception as e:
+        print(f"⚠️  Quantization failed: {e}")
+        print(f"   Keeping FP32 model")
+        if os.path.exists(quant_path):
+            os.remove(quant_path)
+        return None
+
+
+def export_fp16_onnx(onnx_model, original_model, fp32_size,
+                     output_path='../frontend/model.fp16.onnx'):
+    """
+    Save an FP16 variant of the ONNX model for capable WebGPU backends
+
+    Same gate as the quantize pass: the variant is kept only when it is
+    both smaller than the FP32 model and still predicts the same labels.
+    TreeEnsemble thresholds live in node attributes the converter cannot
+    halve, so for this model the gate is expected to reject the variant
+    """
+    print(f"\n🔻 Exporting FP16 variant...")
+
+    try:
+        from onnxconverter_common import float16
+    except ImportError:
+        print(f"⚠️  onnxconverter-common not installed, skipping FP16 export")
+        return None
+
+    try:
+        model_fp16 = float16.convert_float_to_float16(onnx_model,
+                                                      keep_io_types=True)
+        onnx.checker.check_model(model_fp16)
+        fp16_bytes = model_fp16.SerializeToString()
+
+        # FP16 must not change any predicted class label
+        matches = test_onnx_inference(fp16_bytes, original_model)
+        if not matches:
+            print(f"⚠️  FP16 predictions diverge, keeping FP32 only")
+            return None
+
+        # Only worth shipping if it actually shrinks the download
+        if len(fp16_bytes) >= fp32_size:
+            print(f"   FP16 variant is no smaller ({len(fp16_bytes):,} vs "
+                  f"{fp32_size:,} bytes) - the tree")
+            print(f"   attributes stay float32 and the extra Cast only adds work,")
+            print(f"   so keeping the FP32 model only")
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            return None
+
+        with open(output_path, "wb") as f:
+            f.write(fp16_bytes)
+
+        file_size = os.path.getsize(output_path)
+        print(f"✅ FP16 model saved to: {output_path}")
+        print(f"   File size: {file_size:,} bytes ({file_size/1024:.2f} KB)")
+        return output_path
+
+    except Exception as e:
+        print(f"⚠️  FP16 export failed: {e}")
+        print(f"   Keeping FP32 model only")
+        return None
+
+
+def export_tree_json(clf, output_path='../frontend/tree.json'):
+    """
+    Export the decision tree as flat arrays for dependency-free inference
+
+    For a tree this small (9 leaves) a <1KB JSON of node arrays lets the
+    browser predict with a ~10-line traversal loop - no ONNX Runtime Web,
+    no WASM download
+    """
+    print(f"\n🌲 Exporting flat-array tree...")
+
+    t = clf.tree_
+    tree = {
+        'feature': t.feature.astype(int).tolist(),     # -2 marks leaf nodes
+        'threshold': t.threshold.astype(float).tolist(),
+        'left': t.children_left.tolist(),
+        'right': t.children_right.tolist(),
+        'value': t.value[:, 0, :].argmax(axis=1).tolist()  # majority class per node
+    }
+
+    import json
+    with open(output_path, 'w') as f:
+        json.dump(tree, f)
+
+    file_size = os.path.getsize(output_path)
+    print(f"✅ Tree exported to: {output_path}")
+    print(f"   Nodes: {t.node_count}, file size: {file_size:,} bytes")
+    print(f"   Browser usage: walk left/right while feature[i] != -2,")
+    print(f"   then read value[i] - sub-µs inference, zero runtime to load")
+
+
+def export_tree_code(clf, feature_names, js_path='../frontend/tree.js',
+                     py_path='tree_inference.py'):
+    """
+    Generate straight-line if/else predictors from the fitted tree
+
+    For a tree this small, generated code is the fastest inference path
+    of all: no runtime library, no dispatch, just depth-many comparisons
+    """
+    print(f"\n⚙️  Generating if/else predictors from the tree...")
+
+    t = clf.tree_
+
+    def emit_js(node, indent):
+        if t.children_left[node] == -1:
+            return f"{indent}return {int(t.value[node, 0].argmax())};"
+        return (f"{indent}if (x[{t.feature[node]}] <= {t.threshold[node]}) {{\n"
+                f"{emit_js(t.children_left[node], indent + '    ')}\n"
+                f"{indent}}} else {{\n"
+                f"{emit_js(t.children_right[node], indent + '    ')}\n"
+                f"{indent}}}")
+
+    def emit_py(node, indent):
+        if t.children_left[node] == -1:
+            return f"{indent}return {int(t.value[node, 0].argmax())}"
+        return (f"{indent}if x[{t.feature[node]}] <= {t.threshold[node]}:\n"
+                f"{emit_py(t.children_left[node], indent + '    ')}\n"
+                f"{indent}else:\n"
+                f"{emit_py(t.children_right[node], indent + '    ')}")
+
+    feature_order = ', '.join(feature_names)
+
+    js_code = (
+        f"// Auto-generated by convert_to_onnx.py - do not edit by hand.\n"
+        f"// Straight-line decision tree predictor (1 = occupied, 0 = empty).\n"
+        f"// x = [{feature_order}]\n"
+        f"function predictOccupancy(x) {{\n"
+        f"{emit_js(0, '    ')}\n"
+        f"}}\n"
+    )
+    with open(js_path, 'w') as f:
+        f.write(js_code)
+
+    py_code = (
+        f'"""\n'
+        f"Auto-generated by convert_to_onnx.py - do not edit by hand.\n"
+        f"Straight-line decision tree predictor (1 = occupied, 0 = empty).\n"
+        f'"""\n\n\n'
+        f"def predict(x):\n"
+        f'    """Predict occupancy from x = [{feature_order}]"""\n'
+        f"{emit_py(0, '    ')}\n"
+    )
+    with open(py_path, 'w') as f:
+        f.write(py_code)
+
+    print(f"✅ Generated: {js_path} ({os.path.getsize(js_path)} bytes)")
+    print(f"✅ Generated: {py_path} ({os.path.getsize(py_path)} bytes)")
+
+
+def create_model_info(clf, model_size):
     """Create a JSON file with model metadata for the frontend"""
     info = {
         "model": "DecisionTreeClassifier",
@@ -211,11 +438,15 @@ def create_model_info():
             "values": [0, 1],
             "labels": ["Empty", "Occupied"]
         },
-        "accuracy": 0.9948,
-        "model_size_kb": 2.57,
-        "tree_depth": 5,
-        "tree_leaves": 9
+        # Measured values, never hardcoded: size/depth/leaves come from the
+        # converted model, accuracy from the test split train_model.py
+        # evaluated and stashed on the classifier
+        "model_size_kb": round(model_size / 1024, 2),
+        "tree_depth": int(clf.get_depth()),
+        "tree_leaves": int(clf.get_n_leaves())
     }
+    if hasattr(clf, 'test_accuracy_'):
+        info["accuracy"] = round(float(clf.test_accuracy_), 4)
     
     import json
     with open('../frontend/model_info.json', 'w') as f:
@@ -244,14 +475,35 @@ def main():
         print(f"\n❌ ONNX validation failed! Aborting.")
         return
     
-    # 4. Test inference (optional)
-    test_onnx_inference(onnx_model, clf)
-    
-    # 5. Save ONNX model
-    model_size = save_onnx(onnx_model, '../frontend/model.onnx')
-    
-    # 6. Create model info JSON
-    create_model_info()
+    # 4. Serialize once - the test and save steps share the same bytes
+    payload = onnx_model.SerializeToString()
+
+    # 5. Test inference (optional)
+    test_onnx_inference(payload, clf)
+
+    # 6. Save ONNX model
+    model_size = save_onnx(payload, '../frontend/model.onnx')
+
+    # 7. Try uint8 quantization for an even smaller download
+    quantize_onnx('../frontend/model.onnx', clf)
+
+    # 8. Export FP16 variant for WebGPU devices with FP16 support
+    export_fp16_onnx(onnx_model, clf, len(payload),
+                     '../frontend/model.fp16.onnx')
+
+    # Protobuf tree no longer needed - every later step works from files
+    # or the serialized payload
+    del onnx_model
+
+    # 9. Export flat-array tree for runtime-free browser inference
+    export_tree_json(clf, '../frontend/tree.json')
+
+    # 10. Generate dependency-free if/else predictors (JS + Python)
+    export_tree_code(clf, feature_names, '../frontend/tree.js',
+                     'tree_inference.py')
+
+    # 11. Create model info JSON
+    create_model_info(clf, model_size)
     
     # Final summary
     print("\n" + "=" * 70)
@@ -23,65 +23,72 @@ Patterns modeled:
 
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 
-# Seed for reproducibility
-np.random.seed(42)
+# Single PCG64 generator, seeded for reproducibility; every draw below is
+# a bulk fill of a whole array rather than a per-sample call
+rng = np.random.default_rng(42)
+
+# Also write a CSV copy for manual inspection (slower, lossy float text)
+WRITE_DEBUG_CSV = False
 
 def generate_occupancy_data(num_days=30, samples_per_hour=4):
     """
     Generate synthetic occupancy data for a campus room
-    
+
+    All samples are generated in one vectorized pass (no per-sample Python
+    loop), so generation time stays flat even for large num_days.
+
     Args:
         num_days: Number of days to simulate (default 30 for 1 month)
         samples_per_hour: Sensor readings per hour (default 4 = every 15 min)
-    
+
     Returns:
         pandas.DataFrame with features and occupancy label
     """
-    
+
     total_samples = num_days * 24 * samples_per_hour
-    data = []
-    
+    step_minutes = 60 // samples_per_hour
+
     # Start date
     start_date = datetime(2024, 1, 1, 0, 0)
-    
-    for i in range(total_samples):
-        # Calculate current timestamp
-        current_time = start_date + timedelta(minutes=i * (60 // samples_per_hour))
-        hour = current_time.hour
-        day_of_week = current_time.weekday()  # 0=Monday, 6=Sunday
-        minute = current_time.minute
-        
-        # Base occupancy probability based on time patterns
-        occupancy_prob = get_occupancy_probability(hour, day_of_week)
-        
-        # Determine if room is occupied (binary)
-        occupied = 1 if np.random.random() < occupancy_prob else 0
-        
-        # Generate sensor readings based on occupancy
-        ambient_light = generate_light_level(hour, occupied)
-        pir_motion = generate_pir(occupied)
-        phone_presence = generate_phone_presence(occupied)
-        temperature = generate_temperature(hour, occupied)
-        
-        # Add some sensor noise/errors (realistic imperfection)
-        if np.random.random() < 0.05:  # 5% sensor error rate
-            pir_motion = 1 - pir_motion  # False positive/negative
-        
-        data.append({
-            'timestamp': current_time.strftime('%Y-%m-%d %H:%M:%S'),
-            'hour': hour,
-            'day_of_week': day_of_week,
-            'ambient_light': ambient_light,
-            'pir_motion': pir_motion,
-            'phone_presence': phone_presence,
-            'temperature': temperature,
-            'occupied': occupied
-        })
-    
-    df = pd.DataFrame(data)
-    
+
+    # Derive time features for every sample at once
+    timestamps = pd.date_range(start_date, periods=total_samples,
+                               freq=f'{step_minutes}min')
+    minutes = np.arange(total_samples) * step_minutes
+    hour = ((minutes // 60) % 24).astype(np.int8)
+    day_of_week = (((minutes // 1440) + start_date.weekday()) % 7).astype(np.int8)
+
+    # Base occupancy probability based on time patterns
+    occupancy_prob = get_occupancy_probability(hour, day_of_week)
+
+    # Determine if room is occupied (binary)
+    occupied = (rng.random(total_samples, dtype=np.float32) < occupancy_prob).astype(np.int8)
+
+    # Generate sensor readings based on occupancy
+    ambient_light = generate_light_level(hour, occupied)
+    pir_motion = generate_pir(occupied)
+    phone_presence = generate_phone_presence(occupied)
+    temperature = generate_temperature(hour, occupied)
+
+    # Add some sensor noise/errors (realistic imperfection)
+    sensor_error = rng.random(total_samples, dtype=np.float32) < 0.05  # 5% sensor error rate
+    pir_motion = np.where(sensor_error, 1 - pir_motion, pir_motion).astype(np.int8)  # False positive/negative
+
+    df = pd.DataFrame({
+        # Native datetime64 (8 bytes/row); only the CSV debug output ever
+        # formats these as text
+        'timestamp': timestamps,
+        'hour': hour,
+        'day_of_week': day_of_week,
+        'ambient_light': ambient_light,
+        'pir_motion': pir_motion,
+        'phone_presence': phone_presence,
+        'temperature': temperature,
+        'occupied': occupied
+    })
+
     # Print summary statistics
     print("=" * 60)
     print("EdgeNudge - Synthetic Data Generation Complete")
@@ -94,132 +101,152 @@ def generate_occupancy_data(num_days=30, samples_per_hour=4):
     print(f"\nSample data (first 5 rows):")
     print(df.head())
     print("=" * 60)
-    
+
     return df
 
 
+def _build_prob_table():
+    """
+    Build the (7, 24) occupancy-probability table from the campus usage
+    patterns; runs once at import so lookups stay branch-free
+    """
+    table = np.zeros((7, 24), dtype=np.float32)
+
+    for day_of_week in range(7):
+        is_weekend = (day_of_week >= 5)  # Saturday=5, Sunday=6
+        for hour in range(24):
+            # Weekday pattern (classes + study)
+            if not is_weekend:
+                if 0 <= hour < 6:
+                    prob = 0.05  # Late night, very few people
+                elif 6 <= hour < 8:
+                    prob = 0.15  # Early morning, some early risers
+                elif 8 <= hour < 10:
+                    prob = 0.75  # Morning classes, high occupancy
+                elif 10 <= hour < 12:
+                    prob = 0.60  # Late morning
+                elif 12 <= hour < 14:
+                    prob = 0.50  # Lunch time, moderate
+                elif 14 <= hour < 16:
+                    prob = 0.70  # Afternoon classes
+                elif 16 <= hour < 18:
+                    prob = 0.40  # Late afternoon, lower
+                elif 18 <= hour < 23:
+                    prob = 0.80  # Evening study sessions, high
+                else:
+                    prob = 0.30  # Late evening, winding down
+
+            # Weekend pattern (more relaxed, less structured)
+            else:
+                if 0 <= hour < 8:
+                    prob = 0.02  # Late night/early morning, very empty
+                elif 8 <= hour < 11:
+                    prob = 0.20  # Late wake-up
+                elif 11 <= hour < 14:
+                    prob = 0.40  # Brunch/midday
+                elif 14 <= hour < 18:
+                    prob = 0.50  # Afternoon hangout
+                else:
+                    prob = 0.65  # Evening social/study
+
+            table[day_of_week, hour] = prob
+
+    return table
+
+
+# Occupancy probability per (day_of_week, hour), precomputed once
+PROB_TABLE = _build_prob_table()
+
+# Base temperature per hour of day (°C): night / morning / afternoon / evening
+BASE_TEMP_TABLE = np.array([20.0] * 6 + [21.0] * 6 + [23.0] * 6 + [22.0] * 6,
+                           dtype=np.float32)
+
+
 def get_occupancy_probability(hour, day_of_week):
     """
     Return probability of room being occupied based on hour and day
-    Models typical campus room usage patterns
+    Plain table lookup, so hour/day_of_week may be scalars or arrays
     """
-    is_weekend = (day_of_week >= 5)  # Saturday=5, Sunday=6
-    
-    # Weekday pattern (classes + study)
-    if not is_weekend:
-        if 0 <= hour < 6:
-            return 0.05  # Late night, very few people
-        elif 6 <= hour < 8:
-            return 0.15  # Early morning, some early risers
-        elif 8 <= hour < 10:
-            return 0.75  # Morning classes, high occupancy
-        elif 10 <= hour < 12:
-            return 0.60  # Late morning
-        elif 12 <= hour < 14:
-            return 0.50  # Lunch time, moderate
-        elif 14 <= hour < 16:
-            return 0.70  # Afternoon classes
-        elif 16 <= hour < 18:
-            return 0.40  # Late afternoon, lower
-        elif 18 <= hour < 23:
-            return 0.80  # Evening study sessions, high
-        else:
-            return 0.30  # Late evening, winding down
-    
-    # Weekend pattern (more relaxed, less structured)
-    else:
-        if 0 <= hour < 8:
-            return 0.02  # Late night/early morning, very empty
-        elif 8 <= hour < 11:
-            return 0.20  # Late wake-up
-        elif 11 <= hour < 14:
-            return 0.40  # Brunch/midday
-        elif 14 <= hour < 18:
-            return 0.50  # Afternoon hangout
-        elif 18 <= hour < 24:
-            return 0.65  # Evening social/study
-        else:
-            return 0.10
+    return PROB_TABLE[day_of_week, hour]
 
 
 def generate_light_level(hour, occupied):
     """
-    Generate ambient light sensor reading (0-1000 lux)
+    Generate ambient light sensor readings (0-1000 lux) for all samples
     Higher when lights are on (occupied) or daytime
     """
+    n = len(hour)
+    is_day = (hour >= 6) & (hour < 18)
+
     # Natural light during day (even if unoccupied)
-    if 6 <= hour < 18:
-        natural_light = 200 + np.random.randint(-50, 150)
-    else:
-        natural_light = 10 + np.random.randint(-5, 20)
-    
+    natural_light = np.where(is_day,
+                             200 + rng.integers(-50, 150, n, dtype=np.int16),
+                             10 + rng.integers(-5, 20, n, dtype=np.int16))
+
     # Artificial light when occupied
-    if occupied:
-        artificial_light = 400 + np.random.randint(-100, 200)
-    else:
-        artificial_light = 0
-    
+    artificial_light = np.where(occupied == 1,
+                                400 + rng.integers(-100, 200, n, dtype=np.int16),
+                                0)
+
     total_light = natural_light + artificial_light
-    return max(0, min(1000, total_light))  # Clamp to sensor range
+    return np.clip(total_light, 0, 1000).astype(np.int16)  # Clamp to sensor range
 
 
 def generate_pir(occupied):
     """
-    Generate PIR motion sensor reading (0/1)
+    Generate PIR motion sensor readings (0/1) for all samples
     1 = motion detected, 0 = no motion
     Higher probability when occupied
     """
-    if occupied:
-        # 90% chance of detecting motion when occupied
-        return 1 if np.random.random() < 0.90 else 0
-    else:
-        # 5% false positive when empty (sensor noise, curtains moving, etc.)
-        return 1 if np.random.random() < 0.05 else 0
+    # 90% chance of detecting motion when occupied,
+    # 5% false positive when empty (sensor noise, curtains moving, etc.)
+    detect_prob = np.where(occupied == 1, 0.90, 0.05)
+    return (rng.random(len(occupied), dtype=np.float32) < detect_prob).astype(np.int8)
 
 
 def generate_phone_presence(occupied):
     """
-    Generate phone presence signal (0/1)
+    Generate phone presence signals (0/1) for all samples
     Simulates Bluetooth/WiFi beacon detection
     """
-    if occupied:
-        # 85% of occupants have detectable phones
-        return 1 if np.random.random() < 0.85 else 0
-    else:
-        # 2% false positive (phone left behind, nearby signal bleed)
-        return 1 if np.random.random() < 0.02 else 0
+    # 85% of occupants have detectable phones,
+    # 2% false positive (phone left behind, nearby signal bleed)
+    detect_prob = np.where(occupied == 1, 0.85, 0.02)
+    return (rng.random(len(occupied), dtype=np.float32) < detect_prob).astype(np.int8)
 
 
 def generate_temperature(hour, occupied):
     """
-    Generate temperature reading (18-30°C)
+    Generate temperature readings (18-30°C) for all samples
     Slightly higher when occupied (body heat)
     """
-    # Base temperature varies by time of day
-    if 6 <= hour < 12:
-        base_temp = 21.0
-    elif 12 <= hour < 18:
-        base_temp = 23.0
-    elif 18 <= hour < 24:
-        base_temp = 22.0
-    else:
-        base_temp = 20.0
-    
-    # Occupancy adds 1-2°C
-    if occupied:
-        base_temp += np.random.uniform(1.0, 2.5)
-    
-    # Add random noise
-    temp = base_temp + np.random.uniform(-0.5, 0.5)
-    return round(temp, 1)
+    n = len(hour)
+
+    # Base temperature by hour, body heat only when occupied (multiplying
+    # by the 0/1 label keeps it branchless), plus sensor noise - one fused
+    # float32 expression, rounded in bulk
+    temp = (BASE_TEMP_TABLE[hour]
+            + occupied * rng.uniform(1.0, 2.5, n).astype(np.float32)
+            + rng.uniform(-0.5, 0.5, n).astype(np.float32))
+    return np.round(temp, 1).astype(np.float32)
 
 
 if __name__ == "__main__":
     # Generate 30 days of data with 4 samples per hour (every 15 minutes)
     df = generate_occupancy_data(num_days=30, samples_per_hour=4)
-    
-    # Save to CSV
-    output_file = "occupancy_data.csv"
-    df.to_csv(output_file, index=False)
+
+    # Save to Parquet (binary columnar format: exact dtypes, no text parsing)
+    output_file = "occupancy_data.parquet"
+    df.to_parquet(output_file, engine='pyarrow', compression='zstd')
     print(f"\n✅ Data saved to: {output_file}")
+
+    if WRITE_DEBUG_CSV:
+        # pyarrow's multithreaded C++ writer instead of pandas' row-by-row
+        # to_csv; noticeable once num_days grows
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False),
+                        "occupancy_data.csv")
+        print(f"📝 Debug CSV saved to: occupancy_data.csv")
+
     print(f"📊 File size: {len(df)} rows × {len(df.columns)} columns")
@@ -8,7 +8,8 @@ Optimized for: On-device inference (ONNX export)
 
 import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
+from sklearn import set_config
+from sklearn.model_selection import StratifiedShuffleSplit
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.metrics import (
     accuracy_score, 
@@ -24,14 +25,30 @@ import os
 # Seed for reproducibility
 np.random.seed(42)
 
-def load_data(csv_path='occupancy_data.csv'):
+# Column dtypes as written by generate_data.py; passing them to read_csv
+# avoids parsing into int64/float64 and re-casting afterwards
+COLUMN_DTYPES = {
+    'hour': 'int8',
+    'day_of_week': 'int8',
+    'ambient_light': 'int16',
+    'pir_motion': 'int8',
+    'phone_presence': 'int8',
+    'temperature': 'float32',
+    'occupied': 'int8'
+}
+
+def load_data(data_path='occupancy_data.parquet'):
     """Load and prepare training data"""
     print("=" * 70)
     print("EdgeNudge - Model Training Pipeline")
     print("=" * 70)
-    print(f"\n📂 Loading data from: {csv_path}")
-    
-    df = pd.read_csv(csv_path)
+    print(f"\n📂 Loading data from: {data_path}")
+
+    if data_path.endswith('.parquet'):
+        # Parquet round-trips the compact dtypes exactly - no casting needed
+        df = pd.read_parquet(data_path)
+    else:
+        df = pd.read_csv(data_path, dtype=COLUMN_DTYPES)
     print(f"✅ Loaded {len(df)} samples")
     
     # Select features (exclude timestamp)
@@ -39,8 +56,10 @@ def load_data(csv_path='occupancy_data.csv'):
                     'phone_presence', 'temperature']
     target_col = 'occupied'
     
-    X = df[feature_cols].values.astype('float32')
-    y = df[target_col].values.astype('int64')
+    # Single fused pandas->NumPy conversion; copy=False skips the copy when
+    # the block is already contiguous float32
+    X = df[feature_cols].to_numpy(dtype=np.float32, copy=False)
+    y = df[target_col].to_numpy(dtype=np.int64, copy=False)
     
     print(f"\n📊 Dataset Info:")
     print(f"   Features: {feature_cols}")
@@ -70,14 +89,57 @@ def train_model(X_train, y_train, max_depth=8, min_samples_split=10):
         criterion='gini',
         random_state=42
     )
-    
+
     clf.fit(X_train, y_train)
-    
-    print(f"✅ Training complete!")
+    leaves_before = clf.get_n_leaves()
+
+    # Minimal cost-complexity pruning: try candidate alphas on a held-out
+    # validation fold and keep the largest one that still clears the 85%
+    # accuracy gate - fewer nodes means a smaller export and fewer
+    # comparisons per inference
+    print(f"\n✂️  Cost-complexity pruning...")
+    splitter = StratifiedShuffleSplit(n_splits=1, test_size=0.2, random_state=42)
+    fit_idx, val_idx = next(splitter.split(X_train, y_train))
+    X_fit, y_fit = X_train[fit_idx], y_train[fit_idx]
+    X_val, y_val = X_train[val_idx], y_train[val_idx]
+
+    path = clf.cost_complexity_pruning_path(X_fit, y_fit)
+
+    chosen_alpha = 0.0
+    for alpha in np.unique(path.ccp_alphas)[::-1]:  # largest (most pruning) first
+        if alpha <= 0:
+            continue
+        candidate = DecisionTreeClassifier(
+            max_depth=max_depth,
+            min_samples_split=min_samples_split,
+            criterion='gini',
+            ccp_alpha=alpha,
+            random_state=42
+        )
+        candidate.fit(X_fit, y_fit)
+        val_acc = accuracy_score(y_val, candidate.predict(X_val, check_input=False))
+        if val_acc >= 0.85:
+            chosen_alpha = alpha
+            break
+
+    if chosen_alpha > 0:
+        clf = DecisionTreeClassifier(
+            max_depth=max_depth,
+            min_samples_split=min_samples_split,
+            criterion='gini',
+            ccp_alpha=chosen_alpha,
+            random_state=42
+        )
+        clf.fit(X_train, y_train)
+
+    print(f"   ccp_alpha: {chosen_alpha:.6f}")
+    print(f"   Leaves: {leaves_before} → {clf.get_n_leaves()}")
+
+    print(f"\n✅ Training complete!")
     print(f"   Tree depth: {clf.get_depth()}")
     print(f"   Number of leaves: {clf.get_n_leaves()}")
     print(f"   Number of features: {clf.n_features_in_}")
-    
+
     return clf
 
 
@@ -87,11 +149,11 @@ def evaluate_model(clf, X_train, y_train, X_test, y_test):
     print("=" * 70)
     
     # Training set performance
-    y_train_pred = clf.predict(X_train)
+    y_train_pred = clf.predict(X_train, check_input=False)
     train_acc = accuracy_score(y_train, y_train_pred)
     
     # Test set performance
-    y_test_pred = clf.predict(X_test)
+    y_test_pred = clf.predict(X_test, check_input=False)
     test_acc = accuracy_score(y_test, y_test_pred)
     test_precision = precision_score(y_test, y_test_pred)
     test_recall = recall_score(y_test, y_test_pred)
@@ -148,7 +210,9 @@ def evaluate_model(clf, X_train, y_train, X_test, y_test):
 def save_model(clf, filename='model.pkl'):
     """Save trained model"""
     print(f"\n💾 Saving model...")
-    joblib.dump(clf, filename)
+    # zlib-compressed pickle, protocol 5 (out-of-band buffers); joblib.load
+    # auto-detects the compression so nothing downstream changes
+    joblib.dump(clf, filename, compress=('zlib', 3), protocol=5)
     
     file_size = os.path.getsize(filename)
     print(f"✅ Model saved to: {filename}")
@@ -160,59 +224,62 @@ def save_model(clf, filename='model.pkl'):
     return file_size
 
 
+# Demo scenarios as a structured record array, built once at import:
+# 2 AM Tuesday (low light, no motion), 9 AM Wednesday (bright, motion),
+# 8 PM Thursday (lights on), 8 AM Saturday (natural light only)
+SCENARIOS = np.rec.array(
+    [('Late Night (Empty)',        2, 1,  15, 0, 0, 20.0, 0),
+     ('Morning Class (Occupied)',  9, 2, 550, 1, 1, 23.0, 1),
+     ('Evening Study (Occupied)', 20, 3, 600, 1, 1, 23.5, 1),
+     ('Weekend Morning (Empty)',   8, 5, 200, 0, 0, 20.5, 0)],
+    dtype=[('name', 'U32'), ('hour', 'i1'), ('dow', 'i1'), ('light', 'i2'),
+           ('pir', 'i1'), ('phone', 'i1'), ('temp', 'f4'), ('expected', 'i1')])
+
+# Record fields that feed the model, in training feature order
+SCENARIO_FEATURE_FIELDS = ['hour', 'dow', 'light', 'pir', 'phone', 'temp']
+
+
 def predict_sample(clf, feature_names):
     """Test model with sample predictions"""
     print(f"\n🧪 Sample Predictions (Demo Scenarios)")
     print("=" * 70)
-    
-    scenarios = [
-        {
-            'name': 'Late Night (Empty)',
-            'features': [2, 1, 15, 0, 0, 20.0],  # 2 AM, Tuesday, low light, no motion
-            'expected': 0
-        },
-        {
-            'name': 'Morning Class (Occupied)',
-            'features': [9, 2, 550, 1, 1, 23.0],  # 9 AM, Wednesday, bright, motion
-            'expected': 1
-        },
-        {
-            'name': 'Evening Study (Occupied)',
-            'features': [20, 3, 600, 1, 1, 23.5],  # 8 PM, Thursday, lights on
-            'expected': 1
-        },
-        {
-            'name': 'Weekend Morning (Empty)',
-            'features': [8, 5, 200, 0, 0, 20.5],  # 8 AM, Saturday, natural light
-            'expected': 0
-        }
-    ]
-    
-    for scenario in scenarios:
-        features = np.array(scenario['features']).reshape(1, -1)
-        prediction = clf.predict(features)[0]
-        probability = clf.predict_proba(features)[0]
-        
-        status = "✅" if prediction == scenario['expected'] else "❌"
+
+    # One batched predict_proba call for all scenarios; labels fall out of
+    # the probabilities via argmax, so there is no second tree traversal
+    features = np.column_stack([SCENARIOS[f].astype(np.float32)
+                                for f in SCENARIO_FEATURE_FIELDS])
+    probabilities = clf.predict_proba(features, check_input=False)
+    predictions = probabilities.argmax(axis=1)
+
+    print(f"\n   Feature order: {feature_names}")
+
+    for scenario, feat_row, prediction, probability in zip(
+            SCENARIOS, features, predictions, probabilities):
+        status = "✅" if prediction == scenario.expected else "❌"
         pred_label = "Occupied" if prediction == 1 else "Empty"
-        
-        print(f"\n{status} {scenario['name']}")
-        print(f"   Input: {dict(zip(feature_names, scenario['features']))}")
+
+        print(f"\n{status} {scenario.name}")
+        print(f"   Input: {np.array2string(feat_row, precision=1, separator=', ')}")
         print(f"   Predicted: {pred_label} (confidence: {probability[prediction]:.2%})")
         print(f"   Probabilities: [Empty: {probability[0]:.2%}, Occupied: {probability[1]:.2%}]")
 
 
 def main():
     """Main training pipeline"""
-    
+
+    # The dataset is synthetic and fully controlled, so skip sklearn's
+    # per-call finiteness/NaN validation
+    set_config(assume_finite=True)
+
     # 1. Load data
-    X, y, feature_names = load_data('occupancy_data.csv')
+    X, y, feature_names = load_data('occupancy_data.parquet')
     
-    # 2. Split train/test (80/20)
+    # 2. Split train/test (80/20, stratified)
     print(f"\n✂️  Splitting data (80% train, 20% test)...")
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42, stratify=y
-    )
+    splitter = StratifiedShuffleSplit(n_splits=1, test_size=0.2, random_state=42)
+    train_idx, test_idx = next(splitter.split(X, y))
+    X_train, X_test = X[train_idx], X[test_idx]
+    y_train, y_test = y[train_idx], y[test_idx]
     print(f"   Training samples: {len(X_train)}")
     print(f"   Testing samples:  {len(X_test)}")
     
@@ -221,7 +288,11 @@ def main():
     
     # 4. Evaluate
     test_accuracy = evaluate_model(clf, X_train, y_train, X_test, y_test)
-    
+
+    # Stash the measured accuracy on the classifier so the conversion
+    # pipeline can publish it to the frontend without re-running evaluation
+    clf.test_accuracy_ = test_accuracy
+
     # 5. Save model
     model_size = save_model(clf, 'model.pkl')
     
@@ -0,0 +1,12 @@
+"""
+Auto-generated by convert_to_onnx.py - do not edit by hand.
+Straight-line decision tree predictor (1 = occupied, 0 = empty).
+"""
+
+
+def predict(x):
+    """Predict occupancy from x = [hour, day_of_week, ambient_light, pir_motion, phone_presence, temperature]"""
+    if x[2] <= 348.5:
+        return 0
+    else:
+        return 1